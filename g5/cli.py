@@ -4,31 +4,24 @@ Command-line interface for the G5 Spaced Repetition Schedule Generator.
 
 import argparse
 from datetime import datetime
-import pandas as pd
 
 from g5.models.schedule import G5Schedule
 
 
-def generate_g5_schedule(
-    start_date_str,
-    new_sets,
-    set_number=1,
-    json_path="g5_schedule.json",
-    return_schedule=False,
+def build_g5_schedule(
+    start_date_str, new_sets, set_number=1, json_path="g5_schedule.json"
 ):
     """
-    Generate a G5 review schedule for spaced repetition learning.
+    Build a G5 review schedule and save it to JSON.
 
     Args:
       start_date_str: String date in format 'DD-MM-YYYY' to start the schedule
       new_sets: Number of new sets to add to the schedule
       set_number: The set number that corresponds to start_date (default: 1 for first set)
       json_path: Path to JSON file for storing schedule data
-      return_schedule: Whether to return the G5Schedule object in addition to DataFrame
 
     Returns:
-      If return_schedule is False: DataFrame containing the complete schedule
-      If return_schedule is True: (DataFrame, G5Schedule) tuple
+      The G5Schedule object
     """
     try:
         # Convert start date from string to datetime
@@ -50,24 +43,50 @@ def generate_g5_schedule(
         # Save to JSON
         schedule.save_to_json(json_path)
 
-        # Calculate the theoretical day number for display
-        # If this is set 1, day 1 is fine. Otherwise we need to offset
-        day_offset = set_number - 1  # Each set is 1 day apart
-
-        # Get DataFrame with the correct offset for day numbers
-        df = schedule.to_dataframe(day_offset)
-
-        # Return appropriate result based on return_schedule parameter
-        if return_schedule:
-            return df, schedule, None, set_number
-        else:
-            return df
+        return schedule
 
     except Exception as e:
         print(f"Error generating schedule: {e}")
         raise
 
 
+def generate_g5_schedule(
+    start_date_str,
+    new_sets,
+    set_number=1,
+    json_path="g5_schedule.json",
+    return_schedule=False,
+):
+    """
+    Generate a G5 review schedule for spaced repetition learning.
+
+    Args:
+      start_date_str: String date in format 'DD-MM-YYYY' to start the schedule
+      new_sets: Number of new sets to add to the schedule
+      set_number: The set number that corresponds to start_date (default: 1 for first set)
+      json_path: Path to JSON file for storing schedule data
+      return_schedule: Whether to return the G5Schedule object in addition to DataFrame
+
+    Returns:
+      If return_schedule is False: DataFrame containing the complete schedule
+      If return_schedule is True: (DataFrame, G5Schedule) tuple
+    """
+    schedule = build_g5_schedule(start_date_str, new_sets, set_number, json_path)
+
+    # Calculate the theoretical day number for display
+    # If this is set 1, day 1 is fine. Otherwise we need to offset
+    day_offset = set_number - 1  # Each set is 1 day apart
+
+    # Get DataFrame with the correct offset for day numbers
+    df = schedule.to_dataframe(day_offset)
+
+    # Return appropriate result based on return_schedule parameter
+    if return_schedule:
+        return df, schedule, None, set_number
+    else:
+        return df
+
+
 def main():
     """Command line interface for the G5 schedule generator."""
     parser = argparse.ArgumentParser(
@@ -108,19 +127,17 @@ def main():
 
     try:
         # Generate the schedule
-        df, schedule, _, _ = generate_g5_schedule(
+        schedule = build_g5_schedule(
             start_date_str=args.start_date,
             new_sets=args.num_sets,
             set_number=args.set_number,
             json_path=args.output,
-            return_schedule=True,
         )
 
-        # Display the schedule
+        # Display the schedule, numbering days from the starting set
         print(f"\nG5 Schedule (saved to {args.output}):")
         print(f"Starting with Set {args.set_number:02d} on {args.start_date}")
-        pd.set_option("display.max_colwidth", 100)
-        print(df.to_string(index=False))
+        print(schedule.to_text_table(args.set_number - 1))
 
         # Export to iCalendar if requested
         if args.calendar:
@@ -138,12 +155,9 @@ def main():
                 print("3. Select 'Import'")
                 print("4. Upload the .ics file")
 
-        return df
-
     except Exception as e:
         print(f"Failed to generate schedule: {e}")
-        return None
 
 
 if __name__ == "__main__":
-    df = main()
+    main()
@@ -3,10 +3,24 @@ Schedule module for the G5 Spaced Repetition Schedule Generator.
 """
 
 import json
-from datetime import datetime, timedelta
-import pandas as pd
+from datetime import datetime
+import numpy as np
 
-from g5.models.set import Set
+try:
+    import orjson
+except ImportError:  # Optional, only used to speed up JSON writing
+    orjson = None
+
+from g5.models.set import EVENT_OFFSETS, REVIEW_NUMBERS, Set
+from g5.utils.icalendar_export import export_to_ical
+
+# Month abbreviations for display dates, indexed by month number (January is 0)
+MONTH_ABBREVIATIONS = np.array(
+    "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+)
+
+# Zero-padded days of the month ("01" to "31"), indexed by day number - 1
+DAYS_OF_MONTH = np.array([f"{day:02d}" for day in range(1, 32)])
 
 
 class G5Schedule:
@@ -16,6 +30,16 @@ class G5Schedule:
     Handles creation, storage, and formatting of the schedule.
     """
 
+    __slots__ = (
+        "start_date",
+        "_learn_dates",
+        "_names",
+        "_date_strs_cache",
+        "_activities_cache",
+        "_events_cache",
+        "_json_cache",
+    )
+
     def __init__(self, start_date):
         """
         Initialize a new G5 schedule.
@@ -24,7 +48,52 @@ class G5Schedule:
           start_date: Datetime object of when to start the schedule
         """
         self.start_date = start_date
-        self.sets = []
+
+        # Sets are stored column-wise: one learning date and one name per set
+        self._learn_dates = np.empty(0, dtype="datetime64[D]")
+        self._names = np.empty(0, dtype="<U8")
+
+        # Derived tables, rebuilt only after the sets change
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        """Drop all tables derived from the stored sets."""
+        self._date_strs_cache = None
+        self._activities_cache = None
+        self._events_cache = None
+        self._json_cache = {}
+
+    @property
+    def sets(self):
+        """
+        Read-only snapshot of the schedule's sets as a tuple of Set objects.
+
+        The tuple is rebuilt from the stored set columns on every access, so
+        changes to it are not reflected in the schedule; add sets through
+        add_new_sets instead.
+        """
+        # Shift the start date in microseconds to keep its time of day, then
+        # convert all learning dates back to datetime objects in one call
+        offsets = self._learn_dates - self._start_date64()
+        learn_dates = (np.datetime64(self.start_date, "us") + offsets).tolist()
+        return tuple(
+            Set(name, learn_date)
+            for name, learn_date in zip(self._names.tolist(), learn_dates)
+        )
+
+    def _start_date64(self):
+        """Return the start date as a numpy day value."""
+        return np.datetime64(self.start_date, "D")
+
+    def _event_dates(self):
+        """Return an (N, 5) array of learning and review dates, one row per set."""
+        return self._learn_dates[:, None] + EVENT_OFFSETS[None, :]
+
+    def _event_date_strs(self):
+        """Return the (N, 5) event dates formatted as 'YYYY-MM-DD' strings."""
+        if self._date_strs_cache is None:
+            self._date_strs_cache = np.datetime_as_string(self._event_dates(), unit="D")
+        return self._date_strs_cache
 
     def add_new_sets(self, new_sets_count, starting_set_number=1):
         """
@@ -34,13 +103,18 @@ class G5Schedule:
           new_sets_count: Number of new sets to add
           starting_set_number: The set number to start with (default is 1)
         """
-        # Create new sets
-        for i in range(new_sets_count):
-            set_index = starting_set_number + i
-            set_name = f"Set {set_index:02d}"
-            learn_date = self.start_date + timedelta(days=i)
+        if new_sets_count <= 0:
+            return
+
+        # Build all names and learning dates at once
+        day_offsets = np.arange(new_sets_count, dtype="i8")
+        set_numbers = np.char.mod("%02d", day_offsets + starting_set_number)
+        names = np.char.add("Set ", set_numbers)
+        learn_dates = self._start_date64() + day_offsets
 
-            self.sets.append(Set(set_name, learn_date))
+        self._names = np.concatenate((self._names, names))
+        self._learn_dates = np.concatenate((self._learn_dates, learn_dates))
+        self._invalidate_caches()
 
     def get_events_by_date(self):
         """
@@ -49,49 +123,115 @@ class G5Schedule:
         Returns:
           Dictionary mapping dates to sets of activities
         """
-        events_by_date = {}
+        dates, new_words, reviews = self._daily_events()
+        date_strs = np.datetime_as_string(dates, unit="D").tolist()
 
-        # Process all events for all sets
-        for set_obj in self.sets:
-            for event in set_obj.get_all_events():
-                date = event["date"]
-                date_str = date.strftime("%Y-%m-%d")
+        return {
+            date_str: {"New Words": new_word, "Reviews": list(group)}
+            for date_str, new_word, group in zip(date_strs, new_words, reviews)
+        }
 
-                if date_str not in events_by_date:
-                    events_by_date[date_str] = {"New Words": None, "Reviews": []}
+    def get_activity_list(self):
+        """Get a flat list of all activities for JSON storage."""
+        return [
+            {"Date": date_str, "Action": action}
+            for date_str, action in self._activities()
+        ]
 
-                if event["action_type"] == "learn":
-                    events_by_date[date_str]["New Words"] = event["set_name"]
-                else:
-                    review_text = f"{event['set_name']} (R{event['review_number']})"
-                    events_by_date[date_str]["Reviews"].append(review_text)
+    def _activities(self):
+        """
+        Return all activities as cached (date, action) pairs.
 
-        return events_by_date
+        The pairs are immutable, so the cache can be shared safely; callers get
+        fresh dicts from get_activity_list.
+        """
+        if self._activities_cache is None:
+            # Row-major ravel keeps the per-set order: learning, then R1..R4
+            date_strs = self._event_date_strs().ravel()
+            actions = self._actions().ravel()
+            self._activities_cache = tuple(zip(date_strs.tolist(), actions.tolist()))
+        return self._activities_cache
+
+    def _review_labels(self):
+        """Return an (N, 4) array of review labels like 'Set 01 (R1)'."""
+        suffixes = np.char.add(np.char.add(" (R", REVIEW_NUMBERS.astype(str)), ")")
+        return np.char.add(self._names[:, None], suffixes[None, :])
+
+    def _actions(self):
+        """Return an (N, 5) array of action labels, one row per set."""
+        return np.concatenate(
+            (
+                np.char.add("Learn ", self._names)[:, None],
+                np.char.add("Review ", self._review_labels()),
+            ),
+            axis=1,
+        )
+
+    def _daily_events(self):
+        """
+        Group all events by date.
 
-    def get_activity_list(self):
-        """Get a flat list of all activities for JSON storage."""
-        activities = []
-
-        for set_obj in self.sets:
-            # Add learning event
-            learning = set_obj.get_learning_event()
-            activities.append(
-                {
-                    "Date": learning["date"].strftime("%Y-%m-%d"),
-                    "Action": f"Learn {learning['set_name']}",
-                }
-            )
+        Returns:
+          (dates, new_words, reviews) tuple: the sorted datetime64[D] dates that
+          have events, the set learned on each date (None if no set is learned),
+          and the review labels of each date in set order
+        """
+        if self._events_cache is not None:
+            return self._events_cache
+
+        # One stable sort by date; the row-major layout keeps set order within a date
+        all_dates = self._event_dates().ravel()
+        order = np.argsort(all_dates, kind="stable")
+        sorted_dates = all_dates[order]
+        is_first = np.ones(sorted_dates.size, dtype=bool)
+        is_first[1:] = sorted_dates[1:] != sorted_dates[:-1]
+        dates = sorted_dates[is_first]
+        date_idx = np.cumsum(is_first) - 1
+
+        # Learning events (column 0): the last set learned on a date wins
+        is_learn = order % EVENT_OFFSETS.size == 0
+        learned = self._names[order[is_learn] // EVENT_OFFSETS.size]
+        new_words = [None] * len(dates)
+        for idx, name in zip(date_idx[is_learn].tolist(), learned.tolist()):
+            new_words[idx] = name
+
+        # Review events, already grouped by date in sorted order
+        review_order = order[~is_learn]
+        review_labels = self._review_labels()[
+            review_order // EVENT_OFFSETS.size, review_order % EVENT_OFFSETS.size - 1
+        ]
+        counts = np.bincount(date_idx[~is_learn], minlength=len(dates))
+        reviews = [
+            group.tolist() for group in np.split(review_labels, np.cumsum(counts)[:-1])
+        ]
+
+        self._events_cache = (dates, new_words, reviews[: len(dates)])
+        return self._events_cache
+
+    def _display_columns(self, day_offset=0):
+        """
+        Build the Date, New Words and Reviews display columns, one row per day.
 
-            # Add review events
-            for review in set_obj.get_review_events():
-                activities.append(
-                    {
-                        "Date": review["date"].strftime("%Y-%m-%d"),
-                        "Action": f"Review {review['set_name']} (R{review['review_number']})",
-                    }
-                )
+        Args:
+          day_offset: Offset for day numbering (for continuity in set sequences)
+        """
+        dates, new_words, reviews = self._daily_events()
+
+        # Format dates like "Apr 07 (D1)", with day numbers shifted by the offset
+        months = dates.astype("datetime64[M]")
+        month_names = MONTH_ABBREVIATIONS[months.astype("i8") % 12]
+        days_of_month = DAYS_OF_MONTH[(dates - months).astype("i8")]
+        day_numbers = (dates - self._start_date64()).astype("i8") + 1 + day_offset
+        month_days = np.char.add(np.char.add(month_names, " "), days_of_month)
+        formatted_dates = np.char.add(
+            np.char.add(month_days, " (D"), np.char.add(day_numbers.astype(str), ")")
+        )
 
-        return activities
+        return {
+            "Date": formatted_dates.tolist(),
+            "New Words": [new_word or "-" for new_word in new_words],
+            "Reviews": [", ".join(group) or "-" for group in reviews],
+        }
 
     def to_dataframe(self, day_offset=0):
         """
@@ -103,47 +243,101 @@ class G5Schedule:
         Returns:
           Pandas DataFrame with one row per day
         """
-        # Get events organized by date
-        events_by_date = self.get_events_by_date()
+        import pandas as pd
 
-        # Prepare rows for DataFrame
-        display_rows = []
+        # Build the frame column by column instead of from per-row dicts
+        return pd.DataFrame(self._display_columns(day_offset))
 
-        for date_str, activities in sorted(events_by_date.items()):
-            # Calculate day number with offset
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            day_number = (date - self.start_date).days + 1 + day_offset
+    def to_text_table(self, day_offset=0):
+        """
+        Format the schedule as a plain-text table without using pandas.
 
-            # Format date like "Apr 07 (D1)"
-            formatted_date = f"{date.strftime('%b %d')} (D{day_number})"
+        The layout matches DataFrame.to_string(index=False): right-aligned
+        columns separated by a single space.
 
-            # Format reviews as comma-separated string
-            reviews = ", ".join(activities["Reviews"]) if activities["Reviews"] else "-"
+        Args:
+          day_offset: Offset for day numbering (for continuity in set sequences)
 
-            display_rows.append(
-                {
-                    "Date": formatted_date,
-                    "New Words": (
-                        activities["New Words"] if activities["New Words"] else "-"
-                    ),
-                    "Reviews": reviews,
-                }
-            )
+        Returns:
+          String with a header line and one line per day
+        """
+        lines = None
+        for header, values in self._display_columns(day_offset).items():
+            column = np.array([header] + values)
+            column = np.char.rjust(column, np.char.str_len(column).max())
+            if lines is not None:
+                column = np.char.add(np.char.add(lines, " "), column)
+            lines = column
 
-        return pd.DataFrame(display_rows)
+        return "\n".join(lines.tolist())
 
     def to_dict(self):
         """Convert the schedule to a dictionary for JSON storage."""
+        date_strs = self._event_date_strs()
+
         return {
-            "sets": [set_obj.to_dict() for set_obj in self.sets],
+            "sets": [
+                {"set": name, "learned_on": dates[0], "review_days": dates[1:]}
+                for name, dates in zip(self._names.tolist(), date_strs.tolist())
+            ],
             "start_date": self.start_date.strftime("%Y-%m-%d"),
             "full_schedule": self.get_activity_list(),
         }
 
-    def save_to_json(self, json_path):
-        """Save the schedule to a JSON file."""
-        with open(json_path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+    def to_dict_compact(self):
+        """
+        Convert the schedule to a compact dictionary for JSON storage.
+
+        Each set is stored once with its five event dates (learning, then
+        reviews R1 to R4) instead of one entry per activity.
+        """
+        return {
+            "start_date": self.start_date.strftime("%Y-%m-%d"),
+            "sets": [
+                {"name": name, "dates": dates}
+                for name, dates in zip(
+                    self._names.tolist(), self._event_date_strs().tolist()
+                )
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a G5Schedule object from full or compact dictionary data."""
+        schedule = cls(datetime.strptime(data["start_date"], "%Y-%m-%d"))
+        if data["sets"] and "name" in data["sets"][0]:
+            names = [set_data["name"] for set_data in data["sets"]]
+            learn_dates = [set_data["dates"][0] for set_data in data["sets"]]
+        else:
+            names = [set_data["set"] for set_data in data["sets"]]
+            learn_dates = [set_data["learned_on"] for set_data in data["sets"]]
+
+        schedule._names = np.array(names, dtype=str)
+        schedule._learn_dates = np.array(learn_dates, dtype="datetime64[D]")
+        return schedule
+
+    def save_to_json(self, json_path, compact=False):
+        """
+        Save the schedule to a JSON file.
+
+        Args:
+          json_path: Path to the JSON file
+          compact: Whether to write the compact form from to_dict_compact
+            instead of the full form with a per-activity schedule
+        """
+        # Serialised output is cached per form (and start_date, which is part of
+        # the output), so repeated saves only write bytes
+        key = (compact, self.start_date)
+        if key not in self._json_cache:
+            data = self.to_dict_compact() if compact else self.to_dict()
+            if orjson is not None:
+                encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                encoded = json.dumps(data, indent=2).encode("utf-8")
+            self._json_cache[key] = encoded
+
+        with open(json_path, "wb") as f:
+            f.write(self._json_cache[key])
 
     def export_to_ical(self, output_file):
         """
@@ -152,8 +346,14 @@ class G5Schedule:
         Args:
           output_file: Path to save the .ics file
         """
-        activities = self.get_activity_list()
-
-        from g5.utils.icalendar_export import export_to_ical
+        # Tag each activity with its review number (0 for learning) so the
+        # exporter need not parse Action
+        review_numbers = np.tile(np.arange(EVENT_OFFSETS.size), len(self._names))
+        activities = [
+            {"Date": date_str, "Action": action, "review_number": review_number}
+            for (date_str, action), review_number in zip(
+                self._activities(), review_numbers.tolist()
+            )
+        ]
 
         return export_to_ical(activities, output_file)
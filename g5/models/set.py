@@ -3,6 +3,17 @@ Set module for the G5 Spaced Repetition Schedule Generator.
 """
 
 from datetime import datetime, timedelta
+import numpy as np
+
+# Days when reviews happen (day 1 is learning)
+REVIEW_DAYS = (2, 4, 8, 15)
+
+# Day offsets from the learning date for each review, and their review numbers
+REVIEW_OFFSETS_DAYS = np.array(REVIEW_DAYS, dtype="i8") - 1
+REVIEW_NUMBERS = np.arange(1, len(REVIEW_DAYS) + 1, dtype="i8")
+
+# Day offsets from the learning date for the learning event and each review
+EVENT_OFFSETS = np.concatenate((np.zeros(1, dtype="i8"), REVIEW_OFFSETS_DAYS))
 
 
 class Set:
@@ -12,6 +23,10 @@ class Set:
     Each set has a name, learning date, and generates its own review schedule.
     """
 
+    __slots__ = ("name", "learn_date")
+
+    review_days = REVIEW_DAYS
+
     def __init__(self, name, learn_date):
         """
         Initialize a new learning set.
@@ -22,7 +37,6 @@ class Set:
         """
         self.name = name
         self.learn_date = learn_date
-        self.review_days = [2, 4, 8, 15]  # Days when reviews happen (day 1 is learning)
 
     def get_learning_event(self):
         """Return the learning event for this set."""
@@ -30,36 +44,35 @@ class Set:
 
     def get_review_events(self):
         """Generate all review events for this set."""
-        review_events = []
-
-        for i, days_offset in enumerate(self.review_days):
-            review_date = self.learn_date + timedelta(
-                days=days_offset - 1
-            )  # -1 because day 1 is learning
-            review_events.append(
-                {
-                    "date": review_date,
-                    "action_type": "review",
-                    "set_name": self.name,
-                    "review_number": i + 1,
-                }
+        return [
+            {
+                "date": self.learn_date + timedelta(days=days_offset),
+                "action_type": "review",
+                "set_name": self.name,
+                "review_number": review_number,
+            }
+            for days_offset, review_number in zip(
+                REVIEW_OFFSETS_DAYS.tolist(), REVIEW_NUMBERS.tolist()
             )
+        ]
 
-        return review_events
+    def iter_all_events(self):
+        """Yield all events (learning, then reviews) for this set."""
+        yield self.get_learning_event()
+        yield from self.get_review_events()
 
     def get_all_events(self):
         """Get all events (learning and reviews) for this set."""
-        return [self.get_learning_event()] + self.get_review_events()
+        return list(self.iter_all_events())
 
     def to_dict(self):
         """Convert the set to a dictionary for JSON storage."""
         return {
             "set": self.name,
             "learned_on": self.learn_date.strftime("%Y-%m-%d"),
-            "review_days": [
-                (self.learn_date + timedelta(days=day - 1)).strftime("%Y-%m-%d")
-                for day in self.review_days
-            ],
+            "review_days": np.datetime_as_string(
+                np.datetime64(self.learn_date, "D") + REVIEW_OFFSETS_DAYS, unit="D"
+            ).tolist(),
         }
 
     @classmethod
@@ -2,85 +2,137 @@
 iCalendar export utility for the G5 Spaced Repetition Schedule Generator.
 """
 
-from datetime import datetime, timedelta
 import uuid
+import zlib
+import numpy as np
+
+# iCalendar text blocks; RFC 5545 requires CRLF line endings
+CALENDAR_HEADER = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//G5 Schedule Generator//g5_generator.py//EN\r\n"
+)
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+EVENT_TEMPLATE = (
+    "BEGIN:VEVENT\r\n"
+    "SUMMARY:{summary}\r\n"
+    "DTSTART;VALUE=DATE:{dtstart}\r\n"
+    "DTEND;VALUE=DATE:{dtend}\r\n"
+    "UID:{uid}\r\n"
+    "{color_line}"
+    "DESCRIPTION:G5 Spaced Repetition - {action}\r\n"
+    "END:VEVENT\r\n"
+)
+
+# Shared prefix for event UIDs, so no UUID has to be generated per event
+_UID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "g5schedule")
+
+# Characters that must be backslash-escaped in TEXT values
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
+
+# Summary emoji and Google Calendar color, indexed by review number (0 is learning)
+_ICAL_STYLES = (
+    ("📚", "9"),  # Book emoji for learning, blue
+    ("🔍", "5"),  # First review, yellow
+    ("🔄", "5"),  # Second review, yellow
+    ("📝", "7"),  # Third review, orange
+    ("✅", "11"),  # Fourth review, red
+)
+
+# Review markers in Action text, e.g. "Review Set 01 (R2)"
+_REVIEW_MARKERS = {f"(R{number})": number for number in range(1, len(_ICAL_STYLES))}
+
+
+def _review_number(activity):
+    """
+    Return the review number of an activity, 0 for a learning activity.
+
+    Activities built by G5Schedule carry a review_number field; plain
+    full_schedule entries loaded from JSON are classified from their Action
+    text instead, and None is returned if the text matches neither form.
+    """
+    if "review_number" in activity:
+        return activity["review_number"]
+
+    action = activity["Action"]
+    if "Learn" in action:
+        return 0
+    for marker, number in _REVIEW_MARKERS.items():
+        if marker in action:
+            return number
+    return None
+
+
+def _escape_text(value):
+    """Escape an iCalendar TEXT value (RFC 5545, section 3.3.11)."""
+    return value.translate(_TEXT_ESCAPES)
 
 
 def export_to_ical(schedule, output_file):
     """
     Export schedule to iCalendar (.ics) format for import into Google Calendar.
 
+    The .ics text is written directly from fixed templates rather than
+    through a component tree, since every event has the same few fields.
+
     Args:
-      schedule: List of activities from the full_schedule property
+      schedule: List of activities from the full_schedule property, optionally
+        with a "review_number" field (0 for learning)
       output_file: Path to save the .ics file
 
     Returns:
       True if successful, False otherwise
     """
     try:
-        from icalendar import Calendar, Event
-
-        # Create calendar
-        cal = Calendar()
-
-        # Required properties for iCalendar files
-        cal.add("prodid", "-//G5 Schedule Generator//g5_generator.py//EN")
-        cal.add("version", "2.0")
-
-        # Add calendar items - each activity as a separate event
-        for activity in schedule:
-            date_str = activity["Date"]
-            action = activity["Action"]
-
-            # Parse the date
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-
-            # Create an event (instead of a todo item)
-            event = Event()
-
-            # Set summary (title)
-            event.add("summary", action)
-
-            # Set date - all-day event
-            event.add("dtstart", date.date())
-            event.add("dtend", date.date() + timedelta(days=1))  # End of the day
-
-            # Add emoji to the summary based on action type
-            if "Learn" in action:
-                event.add("summary", f"📚 {action}")  # Book emoji for learning
-                event.add("color", "9")  # Blue
-            elif "(R1)" in action:
-                event.add("summary", f"🔍 {action}")  # First review
-                event.add("color", "5")  # Yellow
-            elif "(R2)" in action:
-                event.add("summary", f"🔄 {action}")  # Second review
-                event.add("color", "5")  # Yellow
-            elif "(R3)" in action:
-                event.add("summary", f"📝 {action}")  # Third review
-                event.add("color", "7")  # Orange
-            elif "(R4)" in action:
-                event.add("summary", f"✅ {action}")  # Fourth review
-                event.add("color", "11")  # Red
-
-            # Add a description
-            event.add("description", f"G5 Spaced Repetition - {action}")
-
-            # Add a unique identifier
-            event.add("uid", str(uuid.uuid4()))
-
-            # Add the event to the calendar
-            cal.add_component(event)
+        # All-day events: DTEND is the day after DTSTART, both as YYYYMMDD
+        dates = np.array(
+            [activity["Date"] for activity in schedule], dtype="datetime64[D]"
+        )
+        starts = [
+            date.replace("-", "")
+            for date in np.datetime_as_string(dates, unit="D").tolist()
+        ]
+        ends = [
+            date.replace("-", "")
+            for date in np.datetime_as_string(dates + 1, unit="D").tolist()
+        ]
+
+        # Each activity becomes a separate event
+        events = []
+        for activity, dtstart, dtend in zip(schedule, starts, ends):
+            action = _escape_text(activity["Action"])
+
+            # Deterministic UID from date and action: unique within a calendar and
+            # stable across exports, so re-importing updates instead of duplicating
+            action_hash = zlib.crc32(action.encode("utf-8"))
+            uid = f"{_UID_NAMESPACE}-{dtstart}-{action_hash:08x}"
+
+            # Unrecognised activities get a plain summary and no color
+            summary, color_line = action, ""
+            review_number = _review_number(activity)
+            if review_number is not None:
+                emoji, color = _ICAL_STYLES[review_number]
+                summary, color_line = f"{emoji} {action}", f"COLOR:{color}\r\n"
+
+            events.append(
+                EVENT_TEMPLATE.format(
+                    summary=summary,
+                    dtstart=dtstart,
+                    dtend=dtend,
+                    action=action,
+                    uid=uid,
+                    color_line=color_line,
+                )
+            )
 
         # Write to file
         with open(output_file, "wb") as f:
-            f.write(cal.to_ical())
+            f.write(
+                "".join([CALENDAR_HEADER, *events, CALENDAR_FOOTER]).encode("utf-8")
+            )
 
         return True
 
-    except ImportError:
-        print("Could not create iCalendar file: icalendar package not installed")
-        print("Install with: pip install icalendar")
-        return False
     except Exception as e:
         print(f"Error creating iCalendar file: {e}")
         return False